@@ -0,0 +1,201 @@
+"""
+Claude Reply Parsing
+Extract JSON arrays of objects from free-form model replies, with caching
+"""
+
+import asyncio
+import hashlib
+import json
+import re
+from typing import Any, AsyncIterator, Dict, List
+
+import orjson
+
+# Outermost [...] span in a Claude reply
+JSON_ARRAY_RE = re.compile(r'\[[\s\S]*\]')
+# Whitespace/commas between array elements
+JSON_ARRAY_SEP_RE = re.compile(r'[\s,]*')
+json_decoder = json.JSONDecoder()
+
+
+def is_object_array(data: Any) -> bool:
+    """Check if data is a JSON array of objects (or empty), not e.g. a citation like [1]"""
+    return isinstance(data, list) and (not data or isinstance(data[0], dict))
+
+
+def extract_json_array(text: str) -> List[Any]:
+    """
+    Parse the JSON array of objects embedded in a Claude reply ([] if none)
+    Tries the outermost [...] span first, then decodes from each '[' so
+    prose containing brackets doesn't break parsing
+    """
+    json_match = JSON_ARRAY_RE.search(text)
+    if not json_match:
+        return []
+    
+    error = None
+    try:
+        data = orjson.loads(json_match.group())
+        if is_object_array(data):
+            return data
+    except orjson.JSONDecodeError as e:
+        error = e
+    
+    start = json_match.start()
+    while start != -1:
+        try:
+            data, _ = json_decoder.raw_decode(text, start)
+            if is_object_array(data):
+                return data
+        except json.JSONDecodeError as e:
+            error = e
+        start = text.find('[', start + 1)
+    
+    if error is not None:
+        raise error
+    return []
+
+
+class JSONArrayStreamParser:
+    """
+    Incrementally decode the first JSON array of objects in streamed text
+    feed() returns the elements completed by each new chunk
+    """
+    
+    def __init__(self):
+        self.text = ""
+        self.items: List[Any] = []
+        self.found = False  # opening '[' of the array located
+        self.done = False   # closing ']' reached
+        self._scan = 0      # where to look for the opening '['
+        self._pos = None    # next element position once the array is found
+    
+    def feed(self, chunk: str) -> List[Any]:
+        self.text += chunk
+        new_items = []
+        
+        # Locate '[' followed by an object or ']' (skips prose like "[1]")
+        while self._pos is None:
+            start = self.text.find('[', self._scan)
+            if start == -1:
+                self._scan = len(self.text)
+                return new_items
+            
+            first = JSON_ARRAY_SEP_RE.match(self.text, start + 1).end()
+            if first == len(self.text):
+                self._scan = start
+                return new_items
+            
+            if self.text[first] in '{]':
+                self._pos = first
+                self.found = True
+            else:
+                self._scan = start + 1
+        
+        while not self.done:
+            pos = JSON_ARRAY_SEP_RE.match(self.text, self._pos).end()
+            if pos == len(self.text):
+                break
+            
+            if self.text[pos] == ']':
+                self.done = True
+                break
+            
+            try:
+                item, self._pos = json_decoder.raw_decode(self.text, pos)
+            except json.JSONDecodeError:
+                # Element not complete yet
+                break
+            
+            # Only objects are meaningful elements
+            if isinstance(item, dict):
+                self.items.append(item)
+                new_items.append(item)
+        
+        return new_items
+
+
+class CachedJSONSearch:
+    """
+    Run prompts through Claude and parse the JSON array of objects in each
+    reply. Complete replies are cached (any store with get(key) and
+    set(key, value, expire=...), e.g. diskcache.Cache), and concurrent
+    identical requests share a single Claude call.
+    """
+    
+    def __init__(self, client, cache, model: str, tools: List[Dict[str, Any]], ttl: int):
+        self.client = client
+        self.cache = cache
+        self.model = model
+        self.tools = tools
+        self.ttl = ttl
+        # Requests currently awaiting Claude, so identical calls wait instead of duplicating
+        self.in_flight: Dict[str, asyncio.Event] = {}
+    
+    def cache_key(self, prompt: str, max_tokens: int) -> str:
+        key_source = json.dumps([self.model, max_tokens, self.tools, prompt])
+        return hashlib.blake2b(key_source.encode()).hexdigest()
+    
+    async def stream(self, prompt: str, max_tokens: int) -> AsyncIterator[Any]:
+        """
+        Yield the elements of the JSON array in the reply as soon as each
+        is complete
+        """
+        key = self.cache_key(prompt, max_tokens)
+        
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                for item in cached:
+                    yield item
+                return
+            
+            in_flight = self.in_flight.get(key)
+            if in_flight is None:
+                break
+            await in_flight.wait()
+        
+        in_flight = self.in_flight[key] = asyncio.Event()
+        try:
+            parser = JSONArrayStreamParser()
+            
+            async with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                tools=self.tools,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }]
+            ) as stream:
+                async for text in stream.text_stream:
+                    for item in parser.feed(text):
+                        yield item
+                final_message = await stream.get_final_message()
+            
+            if parser.done:
+                data = parser.items
+            elif parser.found:
+                # Array was cut off: keep what was yielded, but don't cache it
+                return
+            else:
+                # No array recognised while streaming, parse the whole reply
+                data = [item for item in extract_json_array(parser.text) if isinstance(item, dict)]
+                for item in data:
+                    yield item
+                if not data:
+                    # No array at all (refusal, error text, cut-off preamble)
+                    return
+            
+            # Only cache replies Claude finished on its own (not max_tokens etc.)
+            if final_message.stop_reason == "end_turn":
+                self.cache.set(key, data, expire=self.ttl)
+        finally:
+            del self.in_flight[key]
+            in_flight.set()
+    
+    async def search(self, prompt: str, max_tokens: int) -> List[Any]:
+        """
+        Collect the full JSON array from the reply ([] if none)
+        """
+        return [item async for item in self.stream(prompt, max_tokens)]
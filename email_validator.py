@@ -4,24 +4,24 @@ Comprehensive validation without SMTP probing
 """
 
 import re
-import dns.resolver
+import time
+import asyncio
+import functools
+import aiodns
+import httpx
 import whois
-from datetime import datetime
+from cachetools import LRUCache, TTLCache
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import Dict, Tuple, List, Optional
+from urllib.parse import urlsplit
 from email_validator import validate_email as validate_email_format, EmailNotValidError
-
-# Free email providers to exclude
-FREE_PROVIDERS = {
-    'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com',
-    'live.com', 'msn.com', 'rediffmail.com', 'protonmail.com',
-    'yandex.com', 'zoho.com', 'mail.com', 'aol.com'
-}
-
-# Disposable email providers
-DISPOSABLE_PROVIDERS = {
-    'tempmail.com', '10minutemail.com', 'guerrillamail.com',
-    'mailinator.com', 'throwaway.email', 'temp-mail.org'
-}
+from providers import FREE_PROVIDERS, DISPOSABLE_PROVIDERS
+from scoring import (
+    SIGNAL_SOURCE, SIGNAL_OFFICIAL, SIGNAL_MX, SIGNAL_A, SIGNAL_ESTABLISHED,
+    SIGNAL_NEW, SIGNAL_DOMAIN_MATCH, SIGNAL_FREE, SIGNAL_DISPOSABLE, SIGNAL_ROLE,
+    SCORE_TABLE, confidence_label, score_signals
+)
 
 # Role-based addresses (deprioritize)
 ROLE_PATTERNS = [
@@ -29,49 +29,171 @@ ROLE_PATTERNS = [
     'hello', 'help', 'team', 'noreply', 'no-reply'
 ]
 
+# Single alternation, compiled once: one pass over the local part
+# RE2 matches in linear time regardless of how many patterns are added
+try:
+    import re2 as _role_re_engine
+except ImportError:
+    _role_re_engine = re
+_ROLE_RE = _role_re_engine.compile('|'.join(map(re.escape, ROLE_PATTERNS)))
+
+# Cheap shape check, rejects obvious garbage before the full validator
+_QUICK_EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+_validate_format = functools.partial(validate_email_format, check_deliverability=False)
 
+
+@functools.lru_cache(maxsize=100_000)
 def validate_email_syntax(email: str) -> Optional[str]:
     """
     Validate email syntax according to RFC 5322
     Returns normalized email or None if invalid
     """
+    if not _QUICK_EMAIL_RE.match(email):
+        return None
+    
     try:
-        v = validate_email_format(email, check_deliverability=False)
+        v = _validate_format(email)
         return v.email
     except EmailNotValidError:
         return None
 
 
+def classify_email(email: str) -> Tuple[str, str, bool, bool, bool]:
+    """
+    Split an email once and run all provider checks on it
+    Returns: (local_part, domain, is_free, is_disposable, is_role)
+    """
+    local_part, sep, domain = email.rpartition('@')
+    if not sep:
+        # rpartition puts the whole string in the last slot
+        local_part = domain.lower()
+        return local_part, '', True, True, _ROLE_RE.search(local_part) is not None
+    
+    local_part = local_part.lower()
+    domain = domain.lower()
+    return (
+        local_part,
+        domain,
+        domain in FREE_PROVIDERS,
+        domain in DISPOSABLE_PROVIDERS,
+        _ROLE_RE.search(local_part) is not None
+    )
+
+
 def is_free_provider(email: str) -> bool:
     """Check if email uses a free provider"""
-    try:
-        domain = email.split('@')[1].lower()
-        return domain in FREE_PROVIDERS
-    except IndexError:
-        return True
+    return classify_email(email)[2]
 
 
 def is_disposable_provider(email: str) -> bool:
     """Check if email uses a disposable/temporary provider"""
-    try:
-        domain = email.split('@')[1].lower()
-        return domain in DISPOSABLE_PROVIDERS
-    except IndexError:
-        return True
+    return classify_email(email)[3]
 
 
 def is_role_based(email: str) -> bool:
     """Check if email is a role-based address"""
+    return classify_email(email)[4]
+
+
+# Max concurrent domain lookups per batch
+BATCH_CONCURRENCY = 50
+
+# Shared c-ares resolver: all in-flight queries multiplex over one socket
+# Created lazily since it binds to the running event loop
+_resolver: Optional[aiodns.DNSResolver] = None
+
+# DNS answers: (domain, rdtype) -> (records, error args, expiry)
+# Positive answers honor record TTL (clamped), NXDOMAIN/NoAnswer are cached briefly
+DNS_CACHE_MIN_TTL = 60
+DNS_CACHE_MAX_TTL = 86400
+NEGATIVE_CACHE_TTL = 60
+_dns_cache = LRUCache(maxsize=10000)
+
+# c-ares error codes that are definitive answers rather than failures
+_DNS_NEGATIVE_ERRORS = (aiodns.error.ARES_ENOTFOUND, aiodns.error.ARES_ENODATA)
+
+# RDAP (JSON over HTTP) for domain registration dates
+# Shared client, created lazily per event loop like the resolver
+RDAP_URL = "https://rdap.org/domain/{domain}"
+_rdap_client: Optional[httpx.AsyncClient] = None
+_rdap_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Fall back to (slow, blocking) WHOIS when RDAP has no answer
+WHOIS_FALLBACK = False
+
+# Domain ages: domain -> age in days
+# Failed lookups (often transient: timeouts, rate limits) are only kept briefly
+_domain_age_cache = TTLCache(maxsize=2000, ttl=86400)
+_domain_age_failures = TTLCache(maxsize=2000, ttl=NEGATIVE_CACHE_TTL)
+_domain_age_locks: Dict[str, asyncio.Lock] = {}
+
+
+def get_resolver() -> aiodns.DNSResolver:
+    """Shared resolver for the running event loop"""
+    global _resolver
+    loop = asyncio.get_running_loop()
+    if _resolver is None or _resolver.loop is not loop:
+        _resolver = aiodns.DNSResolver(loop=loop, timeout=2, tries=2)
+    return _resolver
+
+
+def get_rdap_client() -> httpx.AsyncClient:
+    """Shared RDAP HTTP client for the running event loop"""
+    global _rdap_client, _rdap_loop
+    loop = asyncio.get_running_loop()
+    if _rdap_client is None or _rdap_loop is not loop:
+        _rdap_client = httpx.AsyncClient(
+            http2=True,
+            timeout=5,
+            follow_redirects=True,  # rdap.org redirects to the registry's server
+            limits=httpx.Limits(max_keepalive_connections=50)
+        )
+        _rdap_loop = loop
+    return _rdap_client
+
+
+def is_no_answer(error: BaseException) -> bool:
+    """Check if a DNS error means the name exists but has no such records"""
+    return (
+        isinstance(error, aiodns.error.DNSError) and
+        error.args[0] == aiodns.error.ARES_ENODATA
+    )
+
+
+async def resolve_cached(domain: str, rdtype: str):
+    """
+    Resolve a record through the shared resolver, with caching
+    Raises aiodns.error.DNSError on failure
+    """
+    key = (domain.lower(), rdtype)
+    cached = _dns_cache.get(key)
+    if cached is not None:
+        answer, error_args, expiry = cached
+        if time.monotonic() < expiry:
+            if error_args is not None:
+                # Fresh exception each time so tracebacks don't pile up on a shared one
+                raise aiodns.error.DNSError(*error_args)
+            return answer
+        del _dns_cache[key]
+    
     try:
-        local_part = email.split('@')[0].lower()
-        return any(pattern in local_part for pattern in ROLE_PATTERNS)
-    except IndexError:
-        return True
+        answer = await get_resolver().query(domain, rdtype)
+    except aiodns.error.DNSError as e:
+        if e.args[0] in _DNS_NEGATIVE_ERRORS:
+            _dns_cache[key] = (None, e.args, time.monotonic() + NEGATIVE_CACHE_TTL)
+        raise
+    
+    ttl = min((r.ttl for r in answer), default=DNS_CACHE_MIN_TTL)
+    ttl = max(DNS_CACHE_MIN_TTL, min(DNS_CACHE_MAX_TTL, ttl))
+    _dns_cache[key] = (answer, None, time.monotonic() + ttl)
+    return answer
 
 
-def validate_domain_dns(domain: str) -> Dict[str, any]:
+async def validate_domain_dns(domain: str) -> Dict[str, any]:
     """
     Validate domain exists and has proper DNS records
+    A, AAAA and MX queries are issued concurrently over one c-ares channel
     """
     result = {
         'exists': False,
@@ -81,41 +203,34 @@ def validate_domain_dns(domain: str) -> Dict[str, any]:
         'error': None
     }
     
-    try:
-        # Check for A/AAAA records
-        try:
-            dns.resolver.resolve(domain, 'A')
-            result['has_a'] = True
-            result['exists'] = True
-        except dns.resolver.NoAnswer:
-            try:
-                dns.resolver.resolve(domain, 'AAAA')
-                result['has_a'] = True
-                result['exists'] = True
-            except:
-                pass
-        except Exception as e:
-            result['error'] = f"DNS lookup failed: {str(e)}"
-            return result
-        
-        # Check for MX records
-        try:
-            mx_records = dns.resolver.resolve(domain, 'MX')
-            result['has_mx'] = True
-            result['mx_records'] = [str(r.exchange) for r in mx_records]
-        except dns.resolver.NoAnswer:
-            # No MX records, but A record exists - might still accept mail
-            pass
-        except Exception as e:
-            result['error'] = f"MX lookup failed: {str(e)}"
-    
-    except Exception as e:
-        result['error'] = str(e)
+    a, aaaa, mx = await asyncio.gather(
+        resolve_cached(domain, 'A'),
+        resolve_cached(domain, 'AAAA'),
+        resolve_cached(domain, 'MX'),
+        return_exceptions=True
+    )
+    
+    # Check for A/AAAA records
+    if not isinstance(a, BaseException) or not isinstance(aaaa, BaseException):
+        result['has_a'] = True
+        result['exists'] = True
+    elif not is_no_answer(a):
+        # NXDOMAIN, timeout, server failure...
+        result['error'] = f"DNS lookup failed: {str(a)}"
+        return result
+    
+    # Check for MX records
+    if not isinstance(mx, BaseException):
+        result['has_mx'] = True
+        result['mx_records'] = [r.host for r in mx]
+    elif not is_no_answer(mx):
+        # NoAnswer: no MX records, but A record exists - might still accept mail
+        result['error'] = f"MX lookup failed: {str(mx)}"
     
     return result
 
 
-def get_domain_age(domain: str) -> Optional[int]:
+def get_domain_age_whois(domain: str) -> Optional[int]:
     """
     Get domain age in days using WHOIS
     Returns None if unable to determine
@@ -137,7 +252,63 @@ def get_domain_age(domain: str) -> Optional[int]:
     return None
 
 
-def check_domain_reputation(domain: str) -> Dict[str, any]:
+async def get_domain_age(domain: str) -> Optional[int]:
+    """
+    Get domain age in days using RDAP (WHOIS if WHOIS_FALLBACK is set)
+    Returns None if unable to determine
+    """
+    try:
+        response = await get_rdap_client().get(RDAP_URL.format(domain=domain))
+        response.raise_for_status()
+        
+        for event in response.json().get('events', []):
+            if event.get('eventAction') == 'registration':
+                creation = datetime.fromisoformat(event['eventDate'])
+                if creation.tzinfo is None:
+                    creation = creation.replace(tzinfo=timezone.utc)
+                
+                age_days = (datetime.now(timezone.utc) - creation).days
+                return age_days
+    except (httpx.HTTPError, ValueError, KeyError):
+        # Network/HTTP failure, bad JSON or a malformed registration event
+        pass
+    
+    if WHOIS_FALLBACK:
+        # WHOIS is blocking, keep it off the event loop
+        return await asyncio.to_thread(get_domain_age_whois, domain)
+    
+    return None
+
+
+async def get_domain_age_cached(domain: str) -> Optional[int]:
+    """
+    Cached wrapper around get_domain_age
+    Concurrent callers for the same domain share a single lookup
+    """
+    domain = domain.lower()
+    if domain in _domain_age_cache:
+        return _domain_age_cache[domain]
+    if domain in _domain_age_failures:
+        return None
+    
+    lock = _domain_age_locks.setdefault(domain, asyncio.Lock())
+    async with lock:
+        if domain in _domain_age_cache:
+            return _domain_age_cache[domain]
+        if domain in _domain_age_failures:
+            return None
+        
+        age = await get_domain_age(domain)
+        if age is None:
+            _domain_age_failures[domain] = True
+        else:
+            _domain_age_cache[domain] = age
+    
+    _domain_age_locks.pop(domain, None)
+    return age
+
+
+async def check_domain_reputation(domain: str) -> Dict[str, any]:
     """
     Check domain reputation indicators
     """
@@ -148,7 +319,7 @@ def check_domain_reputation(domain: str) -> Dict[str, any]:
         'risk_score': 0
     }
     
-    age = get_domain_age(domain)
+    age = await get_domain_age_cached(domain)
     if age is not None:
         result['age_days'] = age
         result['is_new'] = age < 90  # Less than 3 months
@@ -170,222 +341,306 @@ def check_domain_reputation(domain: str) -> Dict[str, any]:
     return result
 
 
+async def resolve_domain(domain: str) -> Dict[str, any]:
+    """
+    Run the network-bound domain checks (DNS, then reputation if it has MX)
+    Returns: {'dns': {...}, 'reputation': {...}}
+    """
+    dns_result = await validate_domain_dns(domain)
+    domain_info = {'dns': dns_result, 'reputation': {}}
+    
+    # Without MX the email can't be included, so skip the reputation lookup
+    if dns_result.get('has_mx', False):
+        domain_info['reputation'] = await check_domain_reputation(domain)
+    
+    return domain_info
+
+
+@functools.lru_cache(maxsize=10_000)
+def get_url_host(url: str) -> str:
+    """
+    Lowercased hostname of a URL ('' if none)
+    Cached since the same source URL repeats across people at a company
+    """
+    if '//' not in url:
+        url = '//' + url
+    try:
+        return urlsplit(url).hostname or ''
+    except ValueError:
+        return ''
+
+
+def is_official_source(source_url: Optional[str], domain: str) -> bool:
+    """Check if source URL is hosted on the domain or one of its subdomains"""
+    if not source_url or not domain:
+        return False
+    host = get_url_host(source_url)
+    domain = domain.lower()
+    return host == domain or host.endswith('.' + domain)
+
+
 def calculate_confidence_score(
     email: str,
     domain: str,
     source_url: Optional[str],
     domain_dns: Dict[str, any],
-    domain_reputation: Dict[str, any]
+    domain_reputation: Dict[str, any],
+    classification: Optional[Tuple[str, str, bool, bool, bool]] = None
 ) -> Tuple[str, int, List[str]]:
     """
     Calculate confidence score based on multiple signals
+    classification is the classify_email() tuple, computed if not given
     Returns: (confidence_label, score, factors)
     """
-    score = 0
-    factors = []
-    
-    # Base score for having an email (20 points)
-    score += 20
-    factors.append('has_email')
-    
-    # Published on official source (30 points)
-    if source_url and domain in source_url:
-        score += 30
-        factors.append('official_source')
-    elif source_url:
-        score += 15
-        factors.append('published_source')
-    
-    # Domain has MX records (20 points)
+    if classification is None:
+        classification = classify_email(email)
+    _, email_domain, free, disposable, role = classification
+    
+    mask = 0
+    if source_url:
+        mask |= SIGNAL_SOURCE
+        if is_official_source(source_url, domain):
+            mask |= SIGNAL_OFFICIAL
     if domain_dns.get('has_mx'):
-        score += 20
-        factors.append('mx_valid')
-    # Domain has A record but no MX (10 points - can still receive mail)
-    elif domain_dns.get('has_a'):
-        score += 10
-        factors.append('a_record')
-    
-    # Domain age and reputation (30 points max)
+        mask |= SIGNAL_MX
+    if domain_dns.get('has_a'):
+        mask |= SIGNAL_A
     if domain_reputation.get('is_established'):
-        score += 20
-        factors.append('established_domain')
-    elif not domain_reputation.get('is_new'):
-        score += 10
-        factors.append('mature_domain')
-    
-    # Email domain matches expected domain (10 points)
-    email_domain = email.split('@')[1] if '@' in email else ''
-    if email_domain == domain or email_domain in domain or domain in email_domain:
-        score += 10
-        factors.append('domain_match')
-    
-    # Penalties
-    if is_free_provider(email):
-        score -= 40
-        factors.append('free_provider_penalty')
-    
-    if is_disposable_provider(email):
-        score -= 50
-        factors.append('disposable_penalty')
-    
-    if is_role_based(email):
-        score -= 10
-        factors.append('role_based')
-    
+        mask |= SIGNAL_ESTABLISHED
     if domain_reputation.get('is_new'):
-        score -= 20
-        factors.append('new_domain_penalty')
-    
-    # Convert to confidence label
-    if score >= 80:
-        confidence = 'High'
-    elif score >= 60:
-        confidence = 'Medium'
-    elif score >= 40:
-        confidence = 'Low'
-    else:
-        confidence = 'Very Low'
-    
-    return confidence, max(0, min(100, score)), factors
+        mask |= SIGNAL_NEW
+    if email_domain in domain or domain in email_domain:
+        mask |= SIGNAL_DOMAIN_MATCH
+    if free:
+        mask |= SIGNAL_FREE
+    if disposable:
+        mask |= SIGNAL_DISPOSABLE
+    if role:
+        mask |= SIGNAL_ROLE
+    
+    confidence, score, factors = SCORE_TABLE[mask]
+    return confidence, score, list(factors)
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    """
+    Result of validate_email_comprehensive
+    Use dataclasses.asdict() to serialize
+    """
+    email: str
+    valid: bool = False
+    normalized_email: Optional[str] = None
+    confidence: str = 'Very Low'
+    confidence_score: int = 0
+    factors: List[str] = field(default_factory=list)
+    checks: Dict[str, bool] = field(default_factory=lambda: {
+        'syntax': False,
+        'free_provider': False,
+        'disposable': False,
+        'role_based': False,
+        'domain_exists': False,
+        'has_mx': False,
+    })
+    domain_info: Dict[str, any] = field(default_factory=dict)
+    should_include: bool = False
+    exclusion_reason: Optional[str] = None
+    company: Optional[str] = None
+    person: Optional[str] = None
+    role: Optional[str] = None
 
 
-def validate_email_comprehensive(
+def precheck_email(
     email: str,
-    expected_domain: str,
-    source_url: Optional[str] = None
-) -> Dict[str, any]:
+    source_url: Optional[str]
+) -> Tuple[ValidationResult, Tuple[str, str, bool, bool, bool]]:
     """
-    Comprehensive email validation
-    Returns detailed validation results
+    Run the local (no network) checks: syntax, providers, source
+    result.exclusion_reason is set if the email is already excluded
+    Returns: (result, classify_email() tuple)
     """
-    result = {
-        'email': email,
-        'valid': False,
-        'normalized_email': None,
-        'confidence': 'Very Low',
-        'confidence_score': 0,
-        'factors': [],
-        'checks': {
-            'syntax': False,
-            'free_provider': False,
-            'disposable': False,
-            'role_based': False,
-            'domain_exists': False,
-            'has_mx': False,
-        },
-        'domain_info': {},
-        'should_include': False,
-        'exclusion_reason': None
-    }
+    result = ValidationResult(email=email)
     
     # Step 1: Syntax validation
     normalized = validate_email_syntax(email)
     if not normalized:
-        result['exclusion_reason'] = 'invalid_syntax'
-        return result
+        result.exclusion_reason = 'invalid_syntax'
+        return result, classify_email(email)
     
-    result['normalized_email'] = normalized
-    result['checks']['syntax'] = True
+    result.normalized_email = normalized
+    result.checks['syntax'] = True
     
     # Step 2: Provider checks
-    result['checks']['free_provider'] = is_free_provider(email)
-    result['checks']['disposable'] = is_disposable_provider(email)
-    result['checks']['role_based'] = is_role_based(email)
+    classification = classify_email(normalized)
+    _, _, free, disposable, role = classification
+    result.checks['free_provider'] = free
+    result.checks['disposable'] = disposable
+    result.checks['role_based'] = role
     
     # Exclude free providers
-    if result['checks']['free_provider']:
-        result['exclusion_reason'] = 'free_provider'
-        return result
+    if result.checks['free_provider']:
+        result.exclusion_reason = 'free_provider'
+        return result, classification
     
     # Exclude disposable providers
-    if result['checks']['disposable']:
-        result['exclusion_reason'] = 'disposable_provider'
-        return result
+    if result.checks['disposable']:
+        result.exclusion_reason = 'disposable_provider'
+        return result, classification
+    
+    # Unsourced emails can never reach High confidence; skip domain lookups
+    if not source_url:
+        result.exclusion_reason = 'no_source'
     
+    return result, classification
+
+
+def apply_domain_checks(
+    result: ValidationResult,
+    classification: Tuple[str, str, bool, bool, bool],
+    expected_domain: str,
+    source_url: Optional[str],
+    domain_info: Dict[str, any]
+) -> ValidationResult:
+    """
+    Complete a precheck_email() result with domain info (from resolve_domain)
+    """
     # Step 3: Domain validation
-    domain = email.split('@')[1]
-    dns_result = validate_domain_dns(domain)
-    result['domain_info']['dns'] = dns_result
-    result['checks']['domain_exists'] = dns_result.get('exists', False)
-    result['checks']['has_mx'] = dns_result.get('has_mx', False)
+    dns_result = domain_info['dns']
+    result.domain_info['dns'] = dns_result
+    result.checks['domain_exists'] = dns_result.get('exists', False)
+    result.checks['has_mx'] = dns_result.get('has_mx', False)
     
     # Exclude if domain doesn't exist
-    if not result['checks']['domain_exists']:
-        result['exclusion_reason'] = 'domain_not_found'
+    if not result.checks['domain_exists']:
+        result.exclusion_reason = 'domain_not_found'
         return result
     
     # Step 4: Domain reputation
-    reputation = check_domain_reputation(domain)
-    result['domain_info']['reputation'] = reputation
+    reputation = domain_info['reputation']
+    result.domain_info['reputation'] = reputation
     
     # Step 5: Calculate confidence
     confidence, score, factors = calculate_confidence_score(
-        email=normalized,
+        email=result.normalized_email,
         domain=expected_domain,
         source_url=source_url,
         domain_dns=dns_result,
-        domain_reputation=reputation
+        domain_reputation=reputation,
+        classification=classification
     )
     
-    result['confidence'] = confidence
-    result['confidence_score'] = score
-    result['factors'] = factors
-    result['valid'] = True
+    # Without MX resolve_domain skips the age lookup, so don't credit
+    # the domain as mature (these emails are never included anyway)
+    if not result.checks['has_mx'] and 'mature_domain' in factors:
+        factors.remove('mature_domain')
+        score = max(0, score - 10)
+        confidence = confidence_label(score)
+    
+    result.confidence = confidence
+    result.confidence_score = score
+    result.factors = factors
+    result.valid = True
     
     # Step 6: Determine if should be included
     # Only include High confidence emails with published sources
     if (confidence == 'High' and 
         source_url and 
-        result['checks']['has_mx'] and
-        not result['checks']['role_based']):
-        result['should_include'] = True
+        result.checks['has_mx'] and
+        not result.checks['role_based']):
+        result.should_include = True
     else:
         if confidence != 'High':
-            result['exclusion_reason'] = 'low_confidence'
+            result.exclusion_reason = 'low_confidence'
         elif not source_url:
-            result['exclusion_reason'] = 'no_source'
-        elif not result['checks']['has_mx']:
-            result['exclusion_reason'] = 'no_mx_records'
-        elif result['checks']['role_based']:
-            result['exclusion_reason'] = 'role_based_address'
+            result.exclusion_reason = 'no_source'
+        elif not result.checks['has_mx']:
+            result.exclusion_reason = 'no_mx_records'
+        elif result.checks['role_based']:
+            result.exclusion_reason = 'role_based_address'
     
     return result
 
 
-def batch_validate_emails(
+async def validate_email_comprehensive(
+    email: str,
+    expected_domain: str,
+    source_url: Optional[str] = None,
+    domain_info: Optional[Dict[str, any]] = None
+) -> ValidationResult:
+    """
+    Comprehensive email validation
+    Pass domain_info (from resolve_domain) to skip the DNS/WHOIS lookups
+    Returns detailed validation results
+    """
+    result, classification = precheck_email(email, source_url)
+    if result.exclusion_reason:
+        return result
+    
+    if domain_info is None:
+        domain_info = await resolve_domain(classification[1])
+    
+    return apply_domain_checks(
+        result, classification, expected_domain, source_url, domain_info
+    )
+
+
+async def batch_validate_emails(
     emails: List[Dict[str, str]]
-) -> List[Dict[str, any]]:
+) -> List[ValidationResult]:
     """
     Validate a batch of emails
     Input: [{'email': '...', 'domain': '...', 'source_url': '...'}, ...]
+    Local checks run in a plain loop; domain checks run concurrently, once
+    per unique domain, and are shared across emails
     Returns: List of validation results
     """
-    results = []
-    
+    # Pass 1: local checks, collecting domains that still need lookups
+    prechecked = []
+    domains = set()
     for item in emails:
-        validation = validate_email_comprehensive(
-            email=item['email'],
-            expected_domain=item.get('domain', ''),
-            source_url=item.get('source_url')
-        )
+        result, classification = precheck_email(item['email'], item.get('source_url'))
+        result.company = item.get('company')
+        result.person = item.get('person')
+        result.role = item.get('role')
         
-        validation['company'] = item.get('company')
-        validation['person'] = item.get('person')
-        validation['role'] = item.get('role')
-        
-        results.append(validation)
+        prechecked.append((item, result, classification))
+        if not result.exclusion_reason:
+            domains.add(classification[1])
+    
+    # Pass 2: network checks per unique domain
+    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+    
+    async def resolve_guarded(domain: str) -> Dict[str, any]:
+        async with semaphore:
+            return await resolve_domain(domain)
+    
+    domains = list(domains)
+    domain_results = await asyncio.gather(
+        *(resolve_guarded(d) for d in domains)
+    )
+    domain_cache = dict(zip(domains, domain_results))
+    
+    # Pass 3: scoring, no awaits
+    results = []
+    for item, result, classification in prechecked:
+        if not result.exclusion_reason:
+            result = apply_domain_checks(
+                result,
+                classification,
+                expected_domain=item.get('domain', ''),
+                source_url=item.get('source_url'),
+                domain_info=domain_cache[classification[1]]
+            )
+        results.append(result)
     
     return results
 
 
-def filter_high_confidence_only(validation_results: List[Dict[str, any]]) -> List[Dict[str, any]]:
+def filter_high_confidence_only(validation_results: List[ValidationResult]) -> List[ValidationResult]:
     """
     Filter to only high-confidence, includable emails
     """
-    return [
-        r for r in validation_results
-        if r.get('should_include', False)
-    ]
+    return [r for r in validation_results if r.should_include]
 
 
 # Example usage
@@ -405,15 +660,15 @@ if __name__ == "__main__":
     ]
     
     for test in test_cases:
-        result = validate_email_comprehensive(
+        result = asyncio.run(validate_email_comprehensive(
             email=test['email'],
             expected_domain=test['domain'],
             source_url=test.get('source_url')
-        )
+        ))
         
         print(f"\nEmail: {test['email']}")
-        print(f"Confidence: {result['confidence']} ({result['confidence_score']})")
-        print(f"Should Include: {result['should_include']}")
-        print(f"Factors: {', '.join(result['factors'])}")
-        if result['exclusion_reason']:
-            print(f"Excluded: {result['exclusion_reason']}")
+        print(f"Confidence: {result.confidence} ({result.confidence_score})")
+        print(f"Should Include: {result.should_include}")
+        print(f"Factors: {', '.join(result.factors)}")
+        if result.exclusion_reason:
+            print(f"Excluded: {result.exclusion_reason}")
@@ -6,12 +6,21 @@ Compliant, high-quality lead discovery for India D2C brands
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, EmailStr, HttpUrl
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
+from contextlib import aclosing
+from urllib.parse import urlsplit
+from dataclasses import dataclass, field
 from datetime import datetime
 import asyncio
+import json
 import anthropic
+import diskcache
 import os
+from cachetools import TTLCache
 from dotenv import load_dotenv
+from claude_json import CachedJSONSearch
+from providers import FREE_PROVIDERS
+from sse_starlette.sse import EventSourceResponse
 
 load_dotenv()
 
@@ -30,8 +39,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Anthropic client
-client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+# Anthropic client (async so concurrent company lookups overlap)
+client = anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+# Max companies researched concurrently per job
+COMPANY_CONCURRENCY = 20
+
+# Lead caps allowed in the per-company prompt (see find_company_leads)
+PROMPT_LEAD_CAPS = (2, 5)
+
+# Claude web search configuration
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+CLAUDE_TOOLS = [{
+    "type": "web_search_20250305",
+    "name": "web_search"
+}]
+
+# Parsed Claude responses, keyed by request hash (one day TTL)
+claude_cache = diskcache.Cache(os.getenv("CLAUDE_CACHE_DIR", ".claude_cache"))
+CLAUDE_CACHE_TTL = 24 * 60 * 60
+
+claude_search = CachedJSONSearch(
+    client,
+    claude_cache,
+    model=CLAUDE_MODEL,
+    tools=CLAUDE_TOOLS,
+    ttl=CLAUDE_CACHE_TTL
+)
 
 # Request/Response Models
 class ResearchFilters(BaseModel):
@@ -61,8 +95,41 @@ class ResearchResponse(BaseModel):
     total_discovered: int
     total_verified: int
 
+@dataclass
+class Job:
+    """
+    In-memory research job state
+    Leads are only ever appended to results; stream subscribers keep their
+    own position in it and are woken through the updated condition.
+    """
+    status: str = "pending"
+    progress: Dict[str, int] = field(
+        default_factory=lambda: {"discovered": 0, "analyzed": 0, "verified": 0}
+    )
+    results: List[LeadResult] = field(default_factory=list)
+    updated: asyncio.Condition = field(default_factory=asyncio.Condition)
+    finished: bool = False
+    started_at: str = field(default_factory=lambda: datetime.now().isoformat())
+    completed_at: Optional[str] = None
+    error: Optional[str] = None
+    
+    async def publish(self, lead: LeadResult):
+        """Append a lead and wake stream subscribers"""
+        self.results.append(lead)
+        self.progress["verified"] = len(self.results)
+        async with self.updated:
+            self.updated.notify_all()
+    
+    async def finish(self):
+        """Mark the job as finished and wake stream subscribers"""
+        self.finished = True
+        async with self.updated:
+            self.updated.notify_all()
+
 # In-memory job storage (use Redis in production)
-jobs = {}
+# Jobs are evicted a day after creation so long-running servers don't leak
+JOB_TTL = 24 * 60 * 60
+jobs: TTLCache = TTLCache(maxsize=10000, ttl=JOB_TTL)
 
 @app.get("/")
 async def root():
@@ -83,15 +150,10 @@ async def start_research(
     import uuid
     job_id = str(uuid.uuid4())
     
-    jobs[job_id] = {
-        "status": "pending",
-        "progress": {"discovered": 0, "analyzed": 0, "verified": 0},
-        "results": [],
-        "started_at": datetime.now().isoformat()
-    }
+    job = jobs[job_id] = Job()
     
     # Run research in background
-    background_tasks.add_task(run_research, job_id, filters)
+    background_tasks.add_task(run_research, job, filters)
     
     return {"job_id": job_id, "status": "started"}
 
@@ -107,47 +169,125 @@ async def get_research_status(job_id: str):
     
     return {
         "job_id": job_id,
-        "status": job["status"],
-        "progress": job["progress"],
-        "results": job.get("results", []),
-        "total_discovered": job["progress"]["discovered"],
-        "total_verified": job["progress"]["verified"]
+        "status": job.status,
+        "progress": job.progress,
+        "results": job.results,
+        "total_discovered": job.progress["discovered"],
+        "total_verified": job.progress["verified"]
     }
 
-async def run_research(job_id: str, filters: ResearchFilters):
+@app.get("/api/research/{job_id}/stream")
+async def stream_research(job_id: str):
+    """
+    Stream leads for a research job as server-sent events
+    Emits a "lead" event per verified lead and a final "done" event
+    """
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    job = jobs[job_id]
+    
+    async def event_generator():
+        # Each subscriber replays from the start, so reconnects see every lead
+        sent = 0
+        while True:
+            async with job.updated:
+                await job.updated.wait_for(
+                    lambda: len(job.results) > sent or job.finished
+                )
+            
+            for lead in job.results[sent:]:
+                sent += 1
+                yield {"event": "lead", "data": lead.model_dump_json()}
+            
+            if job.finished and sent == len(job.results):
+                break
+        
+        yield {
+            "event": "done",
+            "data": json.dumps({"status": job.status, "error": job.error})
+        }
+    
+    return EventSourceResponse(event_generator())
+
+async def run_research(job: Job, filters: ResearchFilters):
     """
     Main research orchestration function
     """
-    jobs[job_id]["status"] = "running"
+    job.status = "running"
     
     try:
         # Phase 1: Discover companies
-        companies = await discover_companies(job_id, filters)
+        companies = await discover_companies(job, filters)
         
-        # Phase 2: Find decision makers and emails
-        results = []
-        for company in companies:
-            leads = await find_company_leads(job_id, company, filters)
-            results.extend(leads)
-            
-            # Update progress
-            jobs[job_id]["progress"]["verified"] = len(results)
-            jobs[job_id]["results"] = results
-            
-            # Limit results to batch size
-            if len(results) >= filters.batch_size:
-                results = results[:filters.batch_size]
-                break
+        # Phase 2: Find decision makers and emails (concurrently)
+        semaphore = asyncio.Semaphore(COMPANY_CONCURRENCY)
         
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["results"] = results
-        jobs[job_id]["completed_at"] = datetime.now().isoformat()
+        async def find_leads_guarded(company: Dict[str, Any]):
+            async with semaphore:
+                # Skip remaining companies once batch size is reached
+                if len(job.results) >= filters.batch_size:
+                    return
+                
+                # Publish each lead as soon as it streams in
+                remaining = filters.batch_size - len(job.results)
+                leads = find_company_leads(job, company, filters, max_leads=remaining)
+                async with aclosing(leads):
+                    async for lead in leads:
+                        # Limit results to batch size
+                        if len(job.results) >= filters.batch_size:
+                            break
+                        
+                        await job.publish(lead)
+        
+        tasks = [asyncio.create_task(find_leads_guarded(c)) for c in companies]
+        try:
+            for finished in asyncio.as_completed(tasks):
+                await finished
+                if len(job.results) >= filters.batch_size:
+                    break
+        finally:
+            # Drop companies still queued or in flight once done (or failed)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        job.status = "completed"
+        job.completed_at = datetime.now().isoformat()
         
     except Exception as e:
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["error"] = str(e)
+        job.status = "failed"
+        job.error = str(e)
+    
+    finally:
+        await job.finish()
+
+def get_domain(website: str) -> str:
+    """
+    Bare lowercased domain of a website ("https://www.x.com/about" -> "x.com")
+    """
+    if '//' not in website:
+        website = '//' + website
+    try:
+        host = urlsplit(website).hostname or ''
+    except ValueError:
+        return ''
+    return host.removeprefix('www.')
+
+async def stream_json_array(prompt: str, max_tokens: int) -> AsyncIterator[Any]:
+    """
+    Yield the JSON array elements of Claude's reply as they stream in
+    """
+    async for item in claude_search.stream(prompt, max_tokens):
+        yield item
+
+async def search_json_array(prompt: str, max_tokens: int) -> List[Any]:
+    """
+    Collect the full JSON array from Claude's reply ([] if none)
+    """
+    return await claude_search.search(prompt, max_tokens)
 
-async def discover_companies(job_id: str, filters: ResearchFilters) -> List[Dict[str, Any]]:
+async def discover_companies(job: Job, filters: ResearchFilters) -> List[Dict[str, Any]]:
     """
     Discover India D2C companies using Claude with web search
     """
@@ -187,46 +327,32 @@ Return as JSON array:
 Only include companies you find evidence for through web search."""
 
     # Call Claude with web search
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4000,
-        tools=[{
-            "type": "web_search_20250305",
-            "name": "web_search"
-        }],
-        messages=[{
-            "role": "user",
-            "content": prompt
-        }]
-    )
-    
-    # Extract text from response
-    full_text = ""
-    for block in message.content:
-        if block.type == "text":
-            full_text += block.text
+    companies = await search_json_array(prompt, max_tokens=4000)
     
-    # Parse JSON from response
-    import json
-    import re
-    
-    json_match = re.search(r'\[[\s\S]*\]', full_text)
-    if json_match:
-        companies = json.loads(json_match.group())
-        
-        # Update progress
-        jobs[job_id]["progress"]["discovered"] = len(companies)
-        
-        return companies
+    # Update progress
+    job.progress["discovered"] = len(companies)
     
-    return []
+    return companies
 
-async def find_company_leads(job_id: str, company: Dict[str, Any], filters: ResearchFilters) -> List[LeadResult]:
+async def find_company_leads(
+    job: Job,
+    company: Dict[str, Any],
+    filters: ResearchFilters,
+    max_leads: int
+) -> AsyncIterator[LeadResult]:
     """
     Find publicly published emails for decision makers at a company
+    Leads are yielded as Claude's reply streams in; the caller enforces
+    max_leads exactly
     """
     website = company['website']
     
+    # Only cap the prompt near the end of a batch, rounded to a fixed
+    # bucket so the prompt (and its cache key) stays stable across jobs
+    lead_cap = next((cap for cap in PROMPT_LEAD_CAPS if max_leads <= cap), None)
+    lead_cap_rule = f"\nReturn at most {lead_cap} people.\n" if lead_cap else ""
+    company_domain = get_domain(website)
+    
     prompt = f"""Find publicly published emails for founders and marketing leaders at {company['name']} ({website}).
 
 STRICT RULES:
@@ -266,90 +392,58 @@ Only return results where:
 - Email domain matches {website}
 - Email is published on an official source
 - Person is clearly in a decision-maker role
-
+{lead_cap_rule}
 Return as JSON array. If no publicly published emails found, return empty array []."""
 
     # Call Claude with web search
-    message = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=2000,
-        tools=[{
-            "type": "web_search_20250305",
-            "name": "web_search"
-        }],
-        messages=[{
-            "role": "user",
-            "content": prompt
-        }]
-    )
-    
-    # Extract text
-    full_text = ""
-    for block in message.content:
-        if block.type == "text":
-            full_text += block.text
-    
-    # Parse JSON
-    import json
-    import re
-    
-    json_match = re.search(r'\[[\s\S]*?\]', full_text)
-    if not json_match:
-        return []
-    
-    try:
-        leads_data = json.loads(json_match.group())
-    except:
-        return []
+    leads_data = stream_json_array(prompt, max_tokens=2000)
     
     # Convert to LeadResult objects with validation
-    results = []
-    for lead in leads_data:
-        # Validate email domain matches company domain
-        email = lead.get('email', '')
-        if not email or '@' not in email:
-            continue
-        
-        email_domain = email.split('@')[1]
-        company_domain = website.replace('www.', '').replace('https://', '').replace('http://', '')
-        
-        # Strict domain matching
-        if email_domain not in company_domain and company_domain not in email_domain:
-            continue
-        
-        # Check for free providers
-        free_providers = ['gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com']
-        if email_domain in free_providers:
-            continue
-        
-        # Validate source URL
-        source_url = lead.get('source_url', '')
-        if not source_url or not source_url.startswith('http'):
-            continue
-        
-        result = LeadResult(
-            company=company['name'],
-            website=website,
-            person=lead.get('person', ''),
-            role=lead.get('role', ''),
-            email=email,
-            source=source_url,
-            confidence=lead.get('confidence', 'High'),
-            confidence_score=90,  # High confidence for published emails
-            validation_factors=[
-                'official_source',
-                'domain_match',
-                'publicly_published'
-            ],
-            discovered_at=datetime.now().isoformat()
-        )
-        
-        results.append(result)
-    
-    # Update progress
-    jobs[job_id]["progress"]["analyzed"] += 1
-    
-    return results
+    async with aclosing(leads_data):
+        try:
+            async for lead in leads_data:
+                # Validate email domain matches company domain
+                email = lead.get('email', '')
+                if not email or '@' not in email:
+                    continue
+                
+                email_domain = email.rpartition('@')[2].lower()
+                
+                # Strict domain matching
+                if email_domain not in company_domain and company_domain not in email_domain:
+                    continue
+                
+                # Check for free providers
+                if email_domain in FREE_PROVIDERS:
+                    continue
+                
+                # Validate source URL
+                source_url = lead.get('source_url', '')
+                if not source_url or not source_url.startswith('http'):
+                    continue
+                
+                yield LeadResult(
+                    company=company['name'],
+                    website=website,
+                    person=lead.get('person', ''),
+                    role=lead.get('role', ''),
+                    email=email,
+                    source=source_url,
+                    confidence=lead.get('confidence', 'High'),
+                    confidence_score=90,  # High confidence for published emails
+                    validation_factors=[
+                        'official_source',
+                        'domain_match',
+                        'publicly_published'
+                    ],
+                    discovered_at=datetime.now().isoformat()
+                )
+        except json.JSONDecodeError:
+            # Unparseable reply, keep whatever leads were already yielded
+            pass
+        finally:
+            # Update progress, also when closed or cancelled once the cap is hit
+            job.progress["analyzed"] += 1
 
 @app.get("/api/health")
 async def health_check():
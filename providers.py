@@ -0,0 +1,17 @@
+"""
+Email Provider Lists
+Shared by the API and the validation module
+"""
+
+# Free email providers to exclude
+FREE_PROVIDERS = frozenset({
+    'gmail.com', 'yahoo.com', 'outlook.com', 'hotmail.com',
+    'live.com', 'msn.com', 'rediffmail.com', 'protonmail.com',
+    'yandex.com', 'zoho.com', 'mail.com', 'aol.com'
+})
+
+# Disposable email providers
+DISPOSABLE_PROVIDERS = frozenset({
+    'tempmail.com', '10minutemail.com', 'guerrillamail.com',
+    'mailinator.com', 'throwaway.email', 'temp-mail.org'
+})
@@ -0,0 +1,96 @@
+"""
+Confidence Scoring
+Every combination of confidence signals, scored once at import
+"""
+
+from typing import Tuple
+
+# Confidence signal bits, combined into a mask by email_validator.calculate_confidence_score
+SIGNAL_SOURCE = 1 << 0
+SIGNAL_OFFICIAL = 1 << 1
+SIGNAL_MX = 1 << 2
+SIGNAL_A = 1 << 3
+SIGNAL_ESTABLISHED = 1 << 4
+SIGNAL_NEW = 1 << 5
+SIGNAL_DOMAIN_MATCH = 1 << 6
+SIGNAL_FREE = 1 << 7
+SIGNAL_DISPOSABLE = 1 << 8
+SIGNAL_ROLE = 1 << 9
+SIGNAL_COUNT = 10
+
+
+def confidence_label(score: int) -> str:
+    """Convert a confidence score to its label"""
+    if score >= 80:
+        return 'High'
+    elif score >= 60:
+        return 'Medium'
+    elif score >= 40:
+        return 'Low'
+    return 'Very Low'
+
+
+def score_signals(mask: int) -> Tuple[str, int, Tuple[str, ...]]:
+    """
+    Score a combination of confidence signals
+    Returns: (confidence_label, score, factors)
+    """
+    score = 0
+    factors = []
+    
+    # Base score for having an email (20 points)
+    score += 20
+    factors.append('has_email')
+    
+    # Published on official source (30 points)
+    if mask & SIGNAL_OFFICIAL:
+        score += 30
+        factors.append('official_source')
+    elif mask & SIGNAL_SOURCE:
+        score += 15
+        factors.append('published_source')
+    
+    # Domain has MX records (20 points)
+    if mask & SIGNAL_MX:
+        score += 20
+        factors.append('mx_valid')
+    # Domain has A record but no MX (10 points - can still receive mail)
+    elif mask & SIGNAL_A:
+        score += 10
+        factors.append('a_record')
+    
+    # Domain age and reputation (30 points max)
+    if mask & SIGNAL_ESTABLISHED:
+        score += 20
+        factors.append('established_domain')
+    elif not mask & SIGNAL_NEW:
+        score += 10
+        factors.append('mature_domain')
+    
+    # Email domain matches expected domain (10 points)
+    if mask & SIGNAL_DOMAIN_MATCH:
+        score += 10
+        factors.append('domain_match')
+    
+    # Penalties
+    if mask & SIGNAL_FREE:
+        score -= 40
+        factors.append('free_provider_penalty')
+    
+    if mask & SIGNAL_DISPOSABLE:
+        score -= 50
+        factors.append('disposable_penalty')
+    
+    if mask & SIGNAL_ROLE:
+        score -= 10
+        factors.append('role_based')
+    
+    if mask & SIGNAL_NEW:
+        score -= 20
+        factors.append('new_domain_penalty')
+    
+    return confidence_label(score), max(0, min(100, score)), tuple(factors)
+
+
+# Every signal combination scored once at import, indexed by mask
+SCORE_TABLE = [score_signals(mask) for mask in range(1 << SIGNAL_COUNT)]
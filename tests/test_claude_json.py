@@ -0,0 +1,87 @@
+"""
+Tests for Claude reply parsing
+"""
+
+import json
+import unittest
+
+from claude_json import JSONArrayStreamParser, extract_json_array
+
+
+def feed_chunked(text, size):
+    """Feed text to a new parser in fixed-size chunks, collecting yielded items"""
+    parser = JSONArrayStreamParser()
+    items = []
+    for i in range(0, len(text), size):
+        items.extend(parser.feed(text[i:i + size]))
+    return parser, items
+
+
+class TestJSONArrayStreamParser(unittest.TestCase):
+    
+    REPLY = (
+        'Sources [1] say:\n```json\n[\n'
+        '  {"person": "A [x]", "email": "a@b.in"},\n'
+        '  {"person": "B", "tags": [1, 2]}\n'
+        ']\n```\nDone [2].'
+    )
+    EXPECTED = [
+        {"person": "A [x]", "email": "a@b.in"},
+        {"person": "B", "tags": [1, 2]},
+    ]
+    
+    def test_chunked(self):
+        for size in (1, 3, 7, len(self.REPLY)):
+            parser, items = feed_chunked(self.REPLY, size)
+            self.assertTrue(parser.done)
+            self.assertEqual(items, self.EXPECTED)
+            self.assertEqual(parser.items, self.EXPECTED)
+    
+    def test_empty_array(self):
+        parser, items = feed_chunked('No emails found: []', 2)
+        self.assertTrue(parser.done)
+        self.assertEqual(items, [])
+    
+    def test_truncated(self):
+        parser, items = feed_chunked('Here [{"a": 1}, {"b":', 4)
+        self.assertTrue(parser.found)
+        self.assertFalse(parser.done)
+        self.assertEqual(items, [{"a": 1}])
+    
+    def test_prose_with_brackets(self):
+        parser, items = feed_chunked('See [1] for sources. [{"a": 1}, {"b":', 5)
+        self.assertTrue(parser.found)
+        self.assertFalse(parser.done)
+        self.assertEqual(items, [{"a": 1}])
+    
+    def test_skips_non_objects(self):
+        parser, items = feed_chunked('[{"a": 1}, 2, "x", {"b": 2}]', 3)
+        self.assertTrue(parser.done)
+        self.assertEqual(items, [{"a": 1}, {"b": 2}])
+    
+    def test_no_array(self):
+        parser, items = feed_chunked('Nothing found [1].', 4)
+        self.assertFalse(parser.found)
+        self.assertEqual(items, [])
+
+
+class TestExtractJSONArray(unittest.TestCase):
+    
+    def test_plain(self):
+        self.assertEqual(extract_json_array('x [{"a": 1}] y'), [{"a": 1}])
+    
+    def test_skips_citations(self):
+        text = 'Sources [1] and [2].\n[{"a": 1}]'
+        self.assertEqual(extract_json_array(text), [{"a": 1}])
+    
+    def test_no_array(self):
+        self.assertEqual(extract_json_array('no array'), [])
+        self.assertEqual(extract_json_array('see [1]'), [])
+    
+    def test_invalid(self):
+        with self.assertRaises(json.JSONDecodeError):
+            extract_json_array('bad [{oops]')
+
+
+if __name__ == "__main__":
+    unittest.main()
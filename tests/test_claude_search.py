@@ -0,0 +1,108 @@
+"""
+Tests for cached, deduplicated Claude JSON searches
+"""
+
+import asyncio
+import unittest
+from types import SimpleNamespace
+
+from claude_json import CachedJSONSearch
+
+
+class FakeCache(dict):
+    def set(self, key, value, expire=None):
+        self[key] = value
+
+
+class FakeStream:
+    def __init__(self, chunks, stop_reason, gate):
+        self.chunks = chunks
+        self.stop_reason = stop_reason
+        self.gate = gate
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    @property
+    async def text_stream(self):
+        await self.gate.wait()
+        for chunk in self.chunks:
+            yield chunk
+    
+    async def get_final_message(self):
+        return SimpleNamespace(stop_reason=self.stop_reason)
+
+
+class FakeClient:
+    def __init__(self, chunks, stop_reason="end_turn"):
+        self.chunks = chunks
+        self.stop_reason = stop_reason
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.messages = self
+    
+    def stream(self, **kwargs):
+        self.calls += 1
+        return FakeStream(self.chunks, self.stop_reason, self.gate)
+
+
+def make_search(client, cache):
+    return CachedJSONSearch(client, cache, model="test-model", tools=[], ttl=60)
+
+
+class TestCachedJSONSearch(unittest.IsolatedAsyncioTestCase):
+    async def test_streams_and_caches_complete_reply(self):
+        client = FakeClient(['Here: [{"a": 1},', ' {"a": 2}]'])
+        cache = FakeCache()
+        search = make_search(client, cache)
+        self.assertEqual(await search.search("p", 100), [{"a": 1}, {"a": 2}])
+        self.assertEqual(list(cache.values()), [[{"a": 1}, {"a": 2}]])
+    
+    async def test_cache_hit_skips_client(self):
+        client = FakeClient(['[{"a": 1}]'])
+        cache = FakeCache()
+        search = make_search(client, cache)
+        cache[search.cache_key("p", 100)] = [{"cached": True}]
+        self.assertEqual(await search.search("p", 100), [{"cached": True}])
+        self.assertEqual(client.calls, 0)
+    
+    async def test_concurrent_identical_calls_share_one_request(self):
+        client = FakeClient(['[{"a": 1}]'])
+        client.gate.clear()
+        search = make_search(client, FakeCache())
+        tasks = [asyncio.create_task(search.search("p", 100)) for _ in range(2)]
+        await asyncio.sleep(0)
+        client.gate.set()
+        results = await asyncio.gather(*tasks)
+        self.assertEqual(results, [[{"a": 1}], [{"a": 1}]])
+        self.assertEqual(client.calls, 1)
+        self.assertEqual(search.in_flight, {})
+    
+    async def test_truncated_array_not_cached(self):
+        client = FakeClient(['[{"a": 1}, {"a":'], stop_reason="max_tokens")
+        cache = FakeCache()
+        search = make_search(client, cache)
+        self.assertEqual(await search.search("p", 100), [{"a": 1}])
+        self.assertEqual(cache, {})
+    
+    async def test_reply_without_array_not_cached(self):
+        client = FakeClient(["Sorry, I couldn't find any companies."])
+        cache = FakeCache()
+        search = make_search(client, cache)
+        self.assertEqual(await search.search("p", 100), [])
+        self.assertEqual(cache, {})
+    
+    async def test_unfinished_reply_not_cached(self):
+        client = FakeClient(['[{"a": 1}]'], stop_reason="max_tokens")
+        cache = FakeCache()
+        search = make_search(client, cache)
+        self.assertEqual(await search.search("p", 100), [{"a": 1}])
+        self.assertEqual(cache, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the precomputed confidence score table
+"""
+
+import unittest
+
+from scoring import (
+    SIGNAL_SOURCE, SIGNAL_OFFICIAL, SIGNAL_MX, SIGNAL_A, SIGNAL_ESTABLISHED,
+    SIGNAL_NEW, SIGNAL_DOMAIN_MATCH, SIGNAL_FREE, SIGNAL_DISPOSABLE, SIGNAL_ROLE,
+    SIGNAL_COUNT, SCORE_TABLE
+)
+
+
+def reference_score(official, source, has_mx, has_a, established, new,
+                    domain_match, free, disposable, role):
+    """The if/elif cascade calculate_confidence_score ran before the table"""
+    score = 20
+    factors = ['has_email']
+    
+    if official:
+        score += 30
+        factors.append('official_source')
+    elif source:
+        score += 15
+        factors.append('published_source')
+    
+    if has_mx:
+        score += 20
+        factors.append('mx_valid')
+    elif has_a:
+        score += 10
+        factors.append('a_record')
+    
+    if established:
+        score += 20
+        factors.append('established_domain')
+    elif not new:
+        score += 10
+        factors.append('mature_domain')
+    
+    if domain_match:
+        score += 10
+        factors.append('domain_match')
+    
+    if free:
+        score -= 40
+        factors.append('free_provider_penalty')
+    if disposable:
+        score -= 50
+        factors.append('disposable_penalty')
+    if role:
+        score -= 10
+        factors.append('role_based')
+    if new:
+        score -= 20
+        factors.append('new_domain_penalty')
+    
+    if score >= 80:
+        confidence = 'High'
+    elif score >= 60:
+        confidence = 'Medium'
+    elif score >= 40:
+        confidence = 'Low'
+    else:
+        confidence = 'Very Low'
+    
+    return confidence, max(0, min(100, score)), factors
+
+
+class TestScoreTable(unittest.TestCase):
+    def test_table_covers_every_mask(self):
+        self.assertEqual(len(SCORE_TABLE), 1 << SIGNAL_COUNT)
+    
+    def test_table_matches_reference_cascade(self):
+        for mask in range(1 << SIGNAL_COUNT):
+            with self.subTest(mask=mask):
+                expected = reference_score(
+                    official=bool(mask & SIGNAL_OFFICIAL),
+                    source=bool(mask & SIGNAL_SOURCE),
+                    has_mx=bool(mask & SIGNAL_MX),
+                    has_a=bool(mask & SIGNAL_A),
+                    established=bool(mask & SIGNAL_ESTABLISHED),
+                    new=bool(mask & SIGNAL_NEW),
+                    domain_match=bool(mask & SIGNAL_DOMAIN_MATCH),
+                    free=bool(mask & SIGNAL_FREE),
+                    disposable=bool(mask & SIGNAL_DISPOSABLE),
+                    role=bool(mask & SIGNAL_ROLE),
+                )
+                confidence, score, factors = SCORE_TABLE[mask]
+                self.assertEqual((confidence, score, list(factors)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()